@@ -0,0 +1,66 @@
+"""
+Throughput of the HTML social-link extractor across parse-pool sizes.
+
+    python benchmarks/bench_html_parse.py --pages 400 --page-kb 512
+
+Prints pages/s for the inline parser and for process pools of 1..N workers;
+throughput should scale roughly with the number of cores.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from leadfinder.core.html_links import extract_socials
+from leadfinder.core.parse_pool import parse_socials
+
+
+def _synthetic_page(size_kb: int) -> bytes:
+    head = (
+        '<html><head><base href="https://example.com/">'
+        '<meta property="og:see_also" content="https://www.instagram.com/example">'
+        '<meta name="twitter:site" content="@example">'
+        '<link rel="me" href="https://www.linkedin.com/company/example"></head><body>'
+    )
+    filler = '<p>Lorem ipsum <a href="/menu">menu</a> <a href="page.html">page</a></p>\n'
+    foot = '<footer><a href="https://facebook.com/example">fb</a></footer></body></html>'
+    n = max(1, (size_kb * 1024) // len(filler))
+    return (head + filler * n + foot).encode()
+
+
+async def _run(pages: int, body: bytes, executor) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(parse_socials(body, "https://example.com/", executor=executor, max_bytes=0) for _ in range(pages))
+    )
+    return pages / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-kb", type=int, default=512)
+    args = parser.parse_args()
+
+    body = _synthetic_page(args.page_kb)
+    print(f"sample result: {extract_socials(body, 'https://example.com/')[0]}")
+
+    start = time.perf_counter()
+    for _ in range(args.pages):
+        extract_socials(body, "https://example.com/")
+    print(f"inline:      {args.pages / (time.perf_counter() - start):8.1f} pages/s")
+
+    cpus = os.cpu_count() or 1
+    sizes = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    for workers in sizes:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            asyncio.run(_run(workers, body, pool))  # warm up workers
+            rate = asyncio.run(_run(args.pages, body, pool))
+        print(f"process x{workers:<3} {rate:8.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
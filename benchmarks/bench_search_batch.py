@@ -0,0 +1,116 @@
+"""
+Provider calls and wall time: N searches run one by one vs. one planned batch.
+
+    python benchmarks/bench_search_batch.py --queries 10 --cities 20
+
+Uses GooglePlacesProvider against an in-process mock of the Places API (fixed latency,
+overlapping result sets across queries) so the numbers reflect call counts, not network.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from leadfinder.core.batch import SearchBatchRunner, plan_search_batch
+from leadfinder.core.nodes.anchors import AnchorGeneratorNode
+from leadfinder.core.nodes.dedupe import CanonicalizeAndDedupeNode
+from leadfinder.core.nodes.discover import DiscoverBusinessesNode
+from leadfinder.core.nodes.planner import RequestPlannerNode
+from leadfinder.core.nodes.score import ScoreLeadsNode
+from leadfinder.core.workflow import WorkflowRunner
+from leadfinder.core.workflow_types import WorkflowContext
+from leadfinder.providers.google_places import GooglePlacesConfig, GooglePlacesProvider
+
+LATENCY_S = 0.005
+PER_PAGE = 20
+
+
+def _mock_transport() -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(LATENCY_S)
+        if request.url.path.endswith(":searchText"):
+            data = json.loads(await request.aread())
+            center = data["locationBias"]["circle"]["center"]
+            # Queries overlap: every query in a city sees the same pool of places.
+            city = f"{center['latitude']:.3f}_{center['longitude']:.3f}"
+            q = sum(map(ord, data["textQuery"])) % 5
+            places = [{"id": f"{city}_{(q * 7 + i) % 30}"} for i in range(PER_PAGE)]
+            return httpx.Response(200, json={"places": places})
+        place_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200,
+            json={
+                "id": place_id,
+                "displayName": {"text": place_id},
+                "formattedAddress": "1 Main St, City, BC, Canada",
+                "types": ["cafe"],
+                "websiteUri": f"https://{place_id}.example",
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def _requests(queries: int, cities: int) -> list[dict]:
+    return [
+        {
+            "query": f"query {q}",
+            "geo_scope": {"center_lat": 49.0 + c * 0.1, "center_lng": -123.0, "radius_km": 5},
+            "target_count": PER_PAGE,
+            "options": {"include_socials": False},
+        }
+        for q in range(queries)
+        for c in range(cities)
+    ]
+
+
+def _post_nodes() -> list:
+    return [CanonicalizeAndDedupeNode(), ScoreLeadsNode()]
+
+
+async def _one_by_one(reqs: list[dict]) -> tuple[float, dict]:
+    calls = {"search": 0, "details": 0}
+    start = time.perf_counter()
+    for i, req in enumerate(reqs):
+        client = httpx.AsyncClient(transport=_mock_transport())
+        provider = GooglePlacesProvider(GooglePlacesConfig(api_key="bench"), client=client)
+        runner = WorkflowRunner(
+            [RequestPlannerNode(), AnchorGeneratorNode(), DiscoverBusinessesNode(provider), *_post_nodes()]
+        )
+        await runner.run(WorkflowContext(search_id=f"s{i}", request=req))
+        await client.aclose()
+        for k in calls:
+            calls[k] += provider.calls[k]
+    return time.perf_counter() - start, calls
+
+
+async def _batched(reqs: list[dict]) -> tuple[float, dict]:
+    start = time.perf_counter()
+    client = httpx.AsyncClient(transport=_mock_transport())
+    provider = GooglePlacesProvider(GooglePlacesConfig(api_key="bench"), client=client, details_cache={})
+    plan = await plan_search_batch("bench", [(f"s{i}", r) for i, r in enumerate(reqs)])
+    await SearchBatchRunner(provider, _post_nodes(), discovery_concurrency=8).run(plan)
+    await client.aclose()
+    return time.perf_counter() - start, dict(provider.calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--cities", type=int, default=20)
+    args = parser.parse_args()
+
+    reqs = _requests(args.queries, args.cities)
+    seq_t, seq_calls = asyncio.run(_one_by_one(reqs))
+    bat_t, bat_calls = asyncio.run(_batched(reqs))
+    print(f"{len(reqs)} searches")
+    print(f"one by one: {seq_t:7.2f}s  calls={seq_calls}")
+    print(f"batched:    {bat_t:7.2f}s  calls={bat_calls}")
+
+
+if __name__ == "__main__":
+    main()
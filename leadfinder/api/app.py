@@ -1,5 +1,15 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from .routes import router
+from ..core.parse_pool import shutdown_parse_executor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    shutdown_parse_executor()
+
 
-app = FastAPI(title="LeadFinder API", version="0.1.0")
+app = FastAPI(title="LeadFinder API", version="0.1.0", lifespan=lifespan)
 app.include_router(router, prefix="/v1")
@@ -1,18 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException
-from .schemas import CreateSearchRequest, CreateSearchResponse, SearchStatusResponse
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from .schemas import (
+    CreateSearchRequest,
+    CreateSearchResponse,
+    SearchStatusResponse,
+    CreateSearchBatchRequest,
+    CreateSearchBatchResponse,
+)
 from ..core.auth import require_api_key
-from ..core.orchestrator import submit_search, get_search_status
+from ..core.checkpoint import CheckpointError
+from ..core.config import settings
+from ..core.events import SearchEvent, default_event_bus
+from ..core.orchestrator import submit_search, submit_search_batch, get_search_status
 
 router = APIRouter()
 
 @router.post("/searches", response_model=CreateSearchResponse, dependencies=[Depends(require_api_key)])
 async def create_search(req: CreateSearchRequest):
-    search_id = await submit_search(req)
+    try:
+        search_id = await submit_search(req)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="search to refresh not found")
+    except CheckpointError:
+        raise HTTPException(status_code=409, detail="search to refresh has an unreadable checkpoint")
     return CreateSearchResponse(search_id=search_id, status="queued")
 
+@router.post("/search-batches", response_model=CreateSearchBatchResponse, dependencies=[Depends(require_api_key)])
+async def create_search_batch(req: CreateSearchBatchRequest):
+    batch_id, search_ids, plan = await submit_search_batch(req)
+    return CreateSearchBatchResponse(batch_id=batch_id, status="queued", search_ids=search_ids, plan=plan)
+
 @router.get("/searches/{search_id}", response_model=SearchStatusResponse, dependencies=[Depends(require_api_key)])
 async def read_search(search_id: str):
     status = await get_search_status(search_id)
     if status is None:
         raise HTTPException(status_code=404, detail="search not found")
     return status
+
+def _sse(event: SearchEvent) -> str:
+    return f"id: {event.seq}\nevent: {event.type}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+@router.get("/searches/{search_id}/events", dependencies=[Depends(require_api_key)])
+async def stream_search_events(search_id: str, request: Request):
+    bus = default_event_bus()
+    if not bus.snapshot(search_id) and await get_search_status(search_id) is None:
+        raise HTTPException(status_code=404, detail="search not found")
+
+    async def events():
+        # Snapshot and subscribe with no await in between so no event can slip through;
+        # doing it here (not in the handler) means a stream cancelled before it starts
+        # never leaves a subscription behind.
+        snapshot = bus.snapshot(search_id)
+        sub = bus.subscribe(search_id)
+        try:
+            status = await get_search_status(search_id)
+            if status is not None and not snapshot:
+                yield f"event: status\ndata: {json.dumps(status, default=str)}\n\n"
+            last_seq = 0
+            for event in snapshot:
+                last_seq = event.seq
+                yield _sse(event)
+                if event.terminal:
+                    return
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.get(), timeout=settings.sse_heartbeat_s)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": heartbeat\n\n"
+                    continue
+                if event.seq <= last_seq:
+                    continue
+                dropped = sub.take_dropped()
+                if dropped:
+                    yield f"event: lagged\ndata: {json.dumps({'dropped': dropped})}\n\n"
+                yield _sse(event)
+                if event.terminal:
+                    return
+        finally:
+            bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
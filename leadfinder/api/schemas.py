@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Literal
 
 PlanTier = Literal["basic", "pro", "enterprise"]
@@ -16,6 +16,7 @@ class SearchOptions(BaseModel):
     prefer_website_socials: bool = True
     max_paid_enrichments: int = 0
     website_fetch_cap: int = 400
+    enrichment_deadline_s: Optional[float] = Field(default=None, gt=0, le=3600)
 
 class CreateSearchRequest(BaseModel):
     query: str
@@ -23,6 +24,11 @@ class CreateSearchRequest(BaseModel):
     target_count: int = Field(ge=1, le=5000)
     plan: PlanTier = "basic"
     options: SearchOptions = SearchOptions()
+    refresh_of: Optional[str] = Field(
+        default=None,
+        pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",
+        description="search_id of an earlier search to refresh; reuses its candidates and fresh enrichments",
+    )
 
 class CreateSearchResponse(BaseModel):
     search_id: str
@@ -34,3 +40,20 @@ class SearchStatusResponse(BaseModel):
     progress: Dict[str, int] = {}
     budget_usage: Dict[str, int] = {}
     summary: Dict[str, float] = {}
+    refresh_of: Optional[str] = None
+
+class CreateSearchBatchRequest(BaseModel):
+    searches: List[CreateSearchRequest] = Field(min_length=1, max_length=500)
+
+    @field_validator("searches")
+    @classmethod
+    def _no_refresh(cls, searches: List[CreateSearchRequest]) -> List[CreateSearchRequest]:
+        if any(s.refresh_of for s in searches):
+            raise ValueError("refresh_of is not supported in search batches; refresh searches individually")
+        return searches
+
+class CreateSearchBatchResponse(BaseModel):
+    batch_id: str
+    status: str
+    search_ids: List[str]
+    plan: Dict[str, int] = {}
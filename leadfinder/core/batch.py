@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..providers.base import Anchor
+from .checkpoint import CheckpointStore
+from .nodes.anchors import AnchorGeneratorNode
+from .nodes.discover import DiscoverBusinessesNode
+from .nodes.planner import RequestPlannerNode
+from .workflow import WorkflowRunner
+from .workflow_types import WorkflowContext
+
+
+def _norm_query(q: str) -> str:
+    return " ".join((q or "").lower().split())
+
+
+def _anchor_key(a: Anchor) -> Tuple[float, float, float]:
+    return (round(a.center_lat, 6), round(a.center_lng, 6), round(a.radius_km, 3))
+
+
+@dataclass
+class DiscoveryUnit:
+    """One (query, anchor) discovery call sequence shared by every search that needs it."""
+    query: str
+    anchor: Anchor
+    target_count: int
+    search_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchPlan:
+    batch_id: str
+    contexts: Dict[str, WorkflowContext]
+    units: List[DiscoveryUnit]
+    # search_id -> indexes into `units`, in the search's anchor order
+    search_units: Dict[str, List[int]]
+    anchors_unique: int = 0
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "searches": len(self.contexts),
+            "anchors_unique": self.anchors_unique,
+            "discovery_units": len(self.units),
+        }
+
+
+async def plan_search_batch(
+    batch_id: str,
+    requests: List[Tuple[str, Dict[str, Any]]],
+    *,
+    planner: Optional[RequestPlannerNode] = None,
+    anchor_generator: Optional[AnchorGeneratorNode] = None,
+) -> BatchPlan:
+    """
+    Merges (search_id, request) pairs into one execution plan: anchors are generated once
+    per geo scope and shared across queries, and each distinct (query, anchor) pair becomes
+    a single discovery unit sized for the largest target among the searches using it.
+    """
+    planner = planner or RequestPlannerNode()
+    anchor_generator = anchor_generator or AnchorGeneratorNode()
+
+    contexts: Dict[str, WorkflowContext] = {}
+    anchors_by_geo: Dict[str, List[Anchor]] = {}
+    anchor_ids: Dict[Tuple[float, float, float], Anchor] = {}
+    unit_index: Dict[Tuple[str, Tuple[float, float, float]], int] = {}
+    units: List[DiscoveryUnit] = []
+    search_units: Dict[str, List[int]] = {}
+
+    for search_id, req in requests:
+        ctx = WorkflowContext(search_id=search_id, request=req)
+        ctx = await planner.run(ctx)
+        ctx.completed_nodes.append(planner.name)
+
+        geo_key = json.dumps(req.get("geo_scope") or {}, sort_keys=True)
+        if geo_key not in anchors_by_geo:
+            ctx = await anchor_generator.run(ctx)
+            anchors_by_geo[geo_key] = [anchor_ids.setdefault(_anchor_key(a), a) for a in ctx.anchors]
+        ctx.anchors = list(anchors_by_geo[geo_key])
+        ctx.completed_nodes.append(anchor_generator.name)
+
+        target = int(ctx.plan.get("target_count", 100))
+        query = str(req.get("query", "")).strip()
+        idxs = []
+        for anchor in ctx.anchors:
+            key = (_norm_query(query), _anchor_key(anchor))
+            i = unit_index.get(key)
+            if i is None:
+                i = unit_index[key] = len(units)
+                units.append(DiscoveryUnit(query=query, anchor=anchor, target_count=target))
+            unit = units[i]
+            unit.target_count = max(unit.target_count, target)
+            unit.search_ids.append(search_id)
+            idxs.append(i)
+
+        contexts[search_id] = ctx
+        search_units[search_id] = idxs
+
+    return BatchPlan(
+        batch_id=batch_id,
+        contexts=contexts,
+        units=units,
+        search_units=search_units,
+        anchors_unique=len(anchor_ids),
+    )
+
+
+class SearchBatchRunner:
+    """
+    Executes a BatchPlan: discovery units run once each (bounded concurrency), their
+    candidates are split back out per search, and the remaining nodes run per search.
+
+    Pass a provider constructed with a shared `details_cache` and the same node instances
+    for every search (notably WebsiteSocialExtractorNode with one WebsiteCache) so place
+    details and website fetches are deduplicated across the whole batch.
+    """
+
+    def __init__(
+        self,
+        provider,
+        nodes: List,
+        *,
+        discovery_concurrency: int = 4,
+        search_concurrency: int = 8,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ):
+        self.discover = DiscoverBusinessesNode(provider)
+        self.nodes = nodes
+        self.discovery_concurrency = discovery_concurrency
+        # Bounds per-search runs (each opens its own website client and fetches in parallel).
+        self.search_concurrency = search_concurrency
+        self.checkpoint_store = checkpoint_store
+
+    async def _run_unit(self, plan: BatchPlan, i: int, sem: asyncio.Semaphore) -> list:
+        unit = plan.units[i]
+        ctx = WorkflowContext(
+            search_id=f"{plan.batch_id}:unit:{i}",
+            request={"query": unit.query},
+            plan={"target_count": unit.target_count},
+            anchors=[unit.anchor],
+        )
+        async with sem:
+            ctx = await self.discover.run(ctx)
+        return ctx.raw_candidates
+
+    async def run(self, plan: BatchPlan) -> Dict[str, WorkflowContext]:
+        sem = asyncio.Semaphore(max(1, self.discovery_concurrency))
+        unit_results = await asyncio.gather(
+            *(self._run_unit(plan, i, sem) for i in range(len(plan.units))),
+            return_exceptions=True,
+        )
+
+        discovered_at = time.time()
+        for search_id, ctx in plan.contexts.items():
+            target = int(ctx.plan.get("target_count", 100))
+            raw = []
+            for i in plan.search_units[search_id]:
+                res = unit_results[i]
+                if isinstance(res, BaseException):
+                    ctx.errors.append(f"discovery failed for anchor {i}: {res}")
+                    continue
+                raw.extend(res)
+                if len(raw) >= target:
+                    break
+            ctx.raw_candidates = raw
+            ctx.discovered_at = discovered_at
+            ctx.completed_nodes.append(self.discover.name)
+
+        runner = WorkflowRunner(self.nodes, checkpoint_store=self.checkpoint_store)
+        search_sem = asyncio.Semaphore(max(1, self.search_concurrency))
+
+        async def run_search(ctx: WorkflowContext) -> WorkflowContext:
+            async with search_sem:
+                return await runner.run(ctx, resume=False)
+
+        done = await asyncio.gather(*(run_search(ctx) for ctx in plan.contexts.values()))
+        return {ctx.search_id: ctx for ctx in done}
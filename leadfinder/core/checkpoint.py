@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..providers.base import Anchor, RawCandidate
+from .workflow_types import WorkflowContext
+
+FORMAT_VERSION = 1
+# How long a finished search can be refreshed from; also the checkpoint retention window.
+REFRESH_TTL_S = 14 * 24 * 3600.0
+
+
+class CheckpointError(ValueError):
+    """A checkpoint exists but is corrupt or written in an unsupported format."""
+
+
+def dump_context(ctx: WorkflowContext) -> Dict[str, Any]:
+    """
+    Converts a context into a JSON-safe dict. `scored` entries that refer to a candidate
+    already in `raw_candidates` are stored as an index instead of a second copy.
+    """
+    index = {id(c): i for i, c in enumerate(ctx.raw_candidates)}
+    scored = []
+    for score, breakdown, c in ctx.scored:
+        ref = index.get(id(c))
+        scored.append([score, breakdown, ref if ref is not None else asdict(c)])
+
+    return {
+        "v": FORMAT_VERSION,
+        "saved_at": time.time(),
+        "search_id": ctx.search_id,
+        "request": ctx.request,
+        "plan": ctx.plan,
+        "anchors": [asdict(a) for a in ctx.anchors],
+        "raw_candidates": [asdict(c) for c in ctx.raw_candidates],
+        "scored": scored,
+        "website_enrichments": ctx.website_enrichments,
+        "results": ctx.results,
+        "budget_usage": ctx.budget_usage,
+        "export_paths": ctx.export_paths,
+        "errors": ctx.errors,
+        "completed_nodes": ctx.completed_nodes,
+        "refresh_of": ctx.refresh_of,
+        "discovered_at": ctx.discovered_at,
+    }
+
+
+def load_context(data: Dict[str, Any]) -> WorkflowContext:
+    if not isinstance(data, dict) or data.get("v") != FORMAT_VERSION:
+        version = data.get("v") if isinstance(data, dict) else None
+        raise CheckpointError(f"unsupported checkpoint version: {version}")
+
+    try:
+        candidates = [RawCandidate(**c) for c in data.get("raw_candidates", [])]
+        scored = []
+        for score, breakdown, ref in data.get("scored", []):
+            c = candidates[ref] if isinstance(ref, int) else RawCandidate(**ref)
+            scored.append((score, breakdown, c))
+        anchors = [Anchor(**a) for a in data.get("anchors", [])]
+        ctx = WorkflowContext(search_id=data["search_id"], request=data["request"])
+    except (KeyError, TypeError, IndexError, ValueError) as e:
+        raise CheckpointError(f"malformed checkpoint: {e}") from e
+    ctx.plan = data.get("plan", {})
+    ctx.anchors = anchors
+    ctx.raw_candidates = candidates
+    ctx.scored = scored
+    ctx.website_enrichments = data.get("website_enrichments", {})
+    ctx.results = data.get("results", [])
+    ctx.budget_usage = data.get("budget_usage", {})
+    ctx.export_paths = data.get("export_paths", {})
+    ctx.errors = data.get("errors", [])
+    ctx.completed_nodes = data.get("completed_nodes", [])
+    ctx.refresh_of = data.get("refresh_of")
+    ctx.discovered_at = data.get("discovered_at")
+    return ctx
+
+
+class CheckpointStore:
+    """
+    Stores one gzipped JSON checkpoint per search under `root/{search_id}.json.gz`.
+    Writes go to a temp file and are renamed into place, so a crash mid-write keeps
+    the previous checkpoint intact. Checkpoints older than `retention_s` (the refresh
+    TTL) are pruned, at most once per `prune_interval_s`, as part of `save`.
+    """
+
+    def __init__(
+        self,
+        root: str = "./checkpoints",
+        retention_s: float = REFRESH_TTL_S,
+        prune_interval_s: float = 3600.0,
+    ):
+        self.root = Path(root)
+        self.retention_s = retention_s
+        self.prune_interval_s = prune_interval_s
+        self._last_prune = 0.0
+
+    def _path(self, search_id: str) -> Path:
+        path = self.root / f"{search_id}.json.gz"
+        root = self.root.resolve()
+        if path.resolve().parent != root:
+            raise ValueError(f"invalid search id for checkpoint: {search_id!r}")
+        return path
+
+    def save(self, ctx: WorkflowContext) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(ctx.search_id)
+        tmp = path.with_suffix(".tmp")
+        payload = json.dumps(dump_context(ctx), separators=(",", ":"), default=str).encode("utf-8")
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(payload, compresslevel=6))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        if time.time() - self._last_prune >= self.prune_interval_s:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Deletes checkpoints (and stray temp files) past the retention window."""
+        now = now if now is not None else time.time()
+        self._last_prune = now
+        removed = 0
+        if not self.root.exists():
+            return removed
+        for path in list(self.root.glob("*.json.gz")) + list(self.root.glob("*.json.tmp")):
+            try:
+                if now - path.stat().st_mtime > self.retention_s:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    def load_raw(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """Returns None for unknown (or invalid) ids; raises CheckpointError if unreadable."""
+        try:
+            path = self._path(search_id)
+        except ValueError:
+            return None
+        if not path.exists():
+            return None
+        try:
+            return json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+        except (OSError, EOFError, ValueError) as e:
+            raise CheckpointError(f"unreadable checkpoint for {search_id}: {e}") from e
+
+    def load(self, search_id: str) -> Optional[WorkflowContext]:
+        data = self.load_raw(search_id)
+        return load_context(data) if data is not None else None
+
+    def delete(self, search_id: str) -> None:
+        try:
+            self._path(search_id).unlink(missing_ok=True)
+        except ValueError:
+            return
+
+
+def _geo(req: Dict[str, Any]) -> Dict[str, Any]:
+    # API requests carry unset geo fields as None; compare only the fields that are set.
+    return {k: v for k, v in (req.get("geo_scope") or {}).items() if v is not None}
+
+
+# Node outputs a refresh run can reuse from the earlier search instead of paying for them again.
+REFRESH_REUSED_NODES = ("anchor_generator", "discover_businesses")
+
+
+def build_refresh_context(
+    store: CheckpointStore,
+    previous_search_id: str,
+    search_id: str,
+    *,
+    request: Optional[Dict[str, Any]] = None,
+    discovery_ttl_s: float = REFRESH_TTL_S,
+) -> WorkflowContext:
+    """
+    Builds a context for re-running an earlier search. Anchors and candidates are reused
+    while the previous discovery is younger than `discovery_ttl_s`; prior website
+    enrichments are carried over so WebsiteSocialExtractorNode only re-fetches stale ones.
+    Cheap nodes (planning, dedupe, scoring, assembly, export) always re-run.
+    """
+    data = store.load_raw(previous_search_id)
+    if data is None:
+        raise KeyError(f"no checkpoint for search {previous_search_id}")
+    prev = load_context(data)
+
+    ctx = WorkflowContext(search_id=search_id, request=request if request is not None else prev.request)
+    ctx.refresh_of = previous_search_id
+    ctx.website_enrichments = dict(prev.website_enrichments)
+
+    discovered = all(n in prev.completed_nodes for n in REFRESH_REUSED_NODES)
+    age = time.time() - float(prev.discovered_at or data.get("saved_at") or 0.0)
+    same_scope = (
+        ctx.request.get("query") == prev.request.get("query")
+        and _geo(ctx.request) == _geo(prev.request)
+        and int(ctx.request.get("target_count", 100)) <= int(prev.request.get("target_count", 100))
+    )
+    if discovered and same_scope and age < discovery_ttl_s:
+        ctx.anchors = list(prev.anchors)
+        ctx.raw_candidates = list(prev.raw_candidates)
+        ctx.discovered_at = prev.discovered_at
+        ctx.completed_nodes = list(REFRESH_REUSED_NODES)
+    return ctx
+
+
+_DEFAULT_STORE: Optional[CheckpointStore] = None
+
+
+def default_checkpoint_store() -> CheckpointStore:
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None:
+        from .config import settings
+
+        _DEFAULT_STORE = CheckpointStore(settings.checkpoint_dir, retention_s=settings.checkpoint_retention_s)
+    return _DEFAULT_STORE
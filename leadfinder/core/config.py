@@ -6,5 +6,14 @@ class Settings(BaseModel):
     google_places_api_key: str = os.getenv("GOOGLE_PLACES_API_KEY", "")
     serper_api_key: str = os.getenv("SERPER_API_KEY", "")
     export_dir: str = os.getenv("EXPORT_DIR", "./exports")
+    html_parse_executor: str = os.getenv("HTML_PARSE_EXECUTOR", "process")
+    html_parse_workers: int = int(os.getenv("HTML_PARSE_WORKERS", "0"))
+    html_parse_max_bytes: int = int(os.getenv("HTML_PARSE_MAX_BYTES", str(2 * 1024 * 1024)))
+    checkpoint_dir: str = os.getenv("CHECKPOINT_DIR", "./checkpoints")
+    checkpoint_retention_s: float = float(os.getenv("CHECKPOINT_RETENTION_S", str(14 * 24 * 3600)))
+    sse_buffer_size: int = int(os.getenv("SSE_BUFFER_SIZE", "256"))
+    sse_heartbeat_s: float = float(os.getenv("SSE_HEARTBEAT_S", "15"))
+    website_cache_ttl_s: float = float(os.getenv("WEBSITE_CACHE_TTL_S", str(60 * 24 * 3600)))
+    website_cache_max_entries: int = int(os.getenv("WEBSITE_CACHE_MAX_ENTRIES", "100000"))
 
 settings = Settings()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+# Event types that describe current state; the latest of each is replayed to new subscribers.
+SNAPSHOT_TYPES = ("status", "node", "progress", "budget_usage")
+TERMINAL_STATUSES = ("complete", "failed", "cancelled")
+
+
+@dataclass(frozen=True)
+class SearchEvent:
+    search_id: str
+    seq: int
+    type: str
+    data: Dict[str, Any]
+
+    @property
+    def terminal(self) -> bool:
+        return self.type == "status" and self.data.get("status") in TERMINAL_STATUSES
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    Bounded per-subscriber buffer. When a slow consumer falls `maxsize` events behind,
+    the oldest events are dropped and `dropped` is incremented; the consumer is expected
+    to resync from a status snapshot (the SSE route emits a `lagged` event).
+    """
+    search_id: str
+    maxsize: int
+    _buf: Deque[SearchEvent] = field(default_factory=deque)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+    dropped: int = 0
+
+    def put(self, event: SearchEvent) -> None:
+        if len(self._buf) >= self.maxsize:
+            self._buf.popleft()
+            self.dropped += 1
+        self._buf.append(event)
+        self._ready.set()
+
+    async def get(self) -> SearchEvent:
+        while not self._buf:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buf.popleft()
+
+    def take_dropped(self) -> int:
+        n, self.dropped = self.dropped, 0
+        return n
+
+
+class EventBus:
+    """In-process pub/sub of workflow events keyed by search_id."""
+
+    def __init__(self, buffer_size: int = 256, max_tracked_searches: int = 1000):
+        self.buffer_size = buffer_size
+        self.max_tracked_searches = max_tracked_searches
+        self._subs: Dict[str, Set[Subscription]] = {}
+        self._latest: "OrderedDict[str, Dict[str, SearchEvent]]" = OrderedDict()
+        self._seq = itertools.count(1)
+
+    def publish(self, search_id: str, type: str, data: Dict[str, Any]) -> SearchEvent:
+        event = SearchEvent(search_id=search_id, seq=next(self._seq), type=type, data=data)
+        if type in SNAPSHOT_TYPES:
+            latest = self._latest.setdefault(search_id, {})
+            latest[type] = event
+            self._latest.move_to_end(search_id)
+            while len(self._latest) > self.max_tracked_searches:
+                self._latest.popitem(last=False)
+        for sub in list(self._subs.get(search_id, ())):
+            sub.put(event)
+        return event
+
+    def snapshot(self, search_id: str) -> List[SearchEvent]:
+        return sorted(self._latest.get(search_id, {}).values(), key=lambda e: e.seq)
+
+    def subscribe(self, search_id: str, maxsize: Optional[int] = None) -> Subscription:
+        sub = Subscription(search_id=search_id, maxsize=maxsize or self.buffer_size)
+        self._subs.setdefault(search_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subs.get(sub.search_id)
+        if subs is None:
+            return
+        subs.discard(sub)
+        if not subs:
+            del self._subs[sub.search_id]
+
+
+_DEFAULT_BUS: Optional[EventBus] = None
+
+
+def default_event_bus() -> EventBus:
+    global _DEFAULT_BUS
+    if _DEFAULT_BUS is None:
+        from .config import settings
+
+        _DEFAULT_BUS = EventBus(buffer_size=settings.sse_buffer_size)
+    return _DEFAULT_BUS
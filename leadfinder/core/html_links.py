@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+# Kept free of httpx/fastapi imports: this module is loaded by parse-pool worker processes.
+
+SOCIAL_DOMAINS = {
+    "instagram.com": "instagram",
+    "facebook.com": "facebook",
+    "linkedin.com": "linkedin",
+    "tiktok.com": "tiktok",
+    "x.com": "x",
+    "twitter.com": "x",
+    "youtube.com": "youtube",
+}
+
+# Meta tags whose content commonly points at a social profile.
+_SOCIAL_META = {"og:see_also", "article:publisher", "article:author", "twitter:site", "twitter:creator"}
+
+_SOCIAL_HINT_RE = re.compile("|".join(re.escape(d) for d in SOCIAL_DOMAINS), re.IGNORECASE)
+
+_TAG_RE = re.compile(rb"<(a|link|meta|base)\b([^>]*)>", re.IGNORECASE)
+_ATTR_RE = re.compile(rb"""([a-zA-Z_:][-\w:.]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+def _attrs(raw: bytes) -> dict:
+    out = {}
+    for m in _ATTR_RE.finditer(raw):
+        name = m.group(1).lower()
+        if name not in out:
+            value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else m.group(4)
+            out[name] = value
+    return out
+
+
+@lru_cache(maxsize=64)
+def _ascii_compatible(encoding: str) -> bool:
+    probe = '<a href="/">'
+    try:
+        return probe.encode(encoding) == probe.encode("ascii")
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _as_ascii_compatible(body: bytes, encoding: str) -> Tuple[bytes, str]:
+    """
+    The tag regexes run on bytes, which only works when markup characters keep their
+    ASCII byte values. Pages in other encodings (UTF-16, UTF-32, ...) are transcoded.
+    """
+    if _ascii_compatible(encoding):
+        return body, encoding
+    try:
+        text = body.decode(encoding, errors="replace")
+    except LookupError:
+        return body, "utf-8"
+    return text.encode("utf-8"), "utf-8"
+
+
+def _decode(value: bytes, encoding: str) -> str:
+    return value.decode(encoding, errors="replace").strip()
+
+
+def _social_key(url: str) -> Optional[str]:
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return None
+    for domain, key in SOCIAL_DOMAINS.items():
+        if host == domain or host.endswith("." + domain):
+            return key
+    return None
+
+
+def extract_links(
+    body: bytes,
+    base_url: str = "",
+    encoding: str = "utf-8",
+    *,
+    social_only: bool = False,
+) -> List[str]:
+    """
+    Single pass over the document collecting absolute URLs from `<a href>`, `<link href>`
+    and social `<meta>` tags (`og:see_also`, `article:publisher`, `twitter:site`, ...).
+    Relative URLs are resolved against `base_url` (or a `<base href>` in the page).
+    With `social_only`, links that cannot point at a social domain are dropped before
+    the (comparatively expensive) URL join.
+    """
+    body, encoding = _as_ascii_compatible(body, encoding)
+    links: List[str] = []
+    base = base_url
+    for m in _TAG_RE.finditer(body):
+        tag = m.group(1).lower()
+        attrs = _attrs(m.group(2))
+        if tag == b"base":
+            if attrs.get(b"href"):
+                base = urljoin(base_url, _decode(attrs[b"href"], encoding))
+            continue
+        if tag == b"meta":
+            prop = attrs.get(b"property") or attrs.get(b"name") or b""
+            if _decode(prop, encoding).lower() not in _SOCIAL_META:
+                continue
+            value = _decode(attrs.get(b"content") or b"", encoding)
+            if value.startswith("@") and len(value) > 1:
+                # twitter:site / twitter:creator hold a handle rather than a URL
+                value = f"https://x.com/{value[1:]}"
+        else:
+            value = _decode(attrs.get(b"href") or b"", encoding)
+        if not value or value.startswith(("#", "mailto:", "tel:", "javascript:")):
+            continue
+        if social_only and not _SOCIAL_HINT_RE.search(value):
+            continue
+        links.append(urljoin(base, value) if base else value)
+    return links
+
+
+def pick_socials(urls: List[str]) -> Tuple[dict, List[str]]:
+    socials = {}
+    reasons = []
+    for u in urls:
+        key = _social_key(u)
+        if key and key not in socials:
+            socials[key] = u
+            reasons.append("linked_from_website")
+    return socials, reasons
+
+
+def extract_socials(body: bytes, base_url: str = "", encoding: str = "utf-8") -> Tuple[dict, List[str]]:
+    """Parse-pool entry point: raw HTML bytes in, (socials, reasons) out."""
+    return pick_socials(extract_links(body, base_url, encoding, social_only=True))
@@ -26,7 +26,7 @@ class AssembleResultsNode:
                     "socials": e.get("socials") or {},
                     "social_confidence": float(e.get("confidence") or 0.0),
                     "social_reasons": e.get("reasons") or [],
-                    "needs_review": False,
+                    "needs_review": bool(e.get("needs_review")),
                 }
             )
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from ..workflow_types import WorkflowContext
 
 
@@ -31,4 +33,5 @@ class DiscoverBusinessesNode:
                 break
 
         ctx.raw_candidates = raw
+        ctx.discovered_at = time.time()
         return ctx
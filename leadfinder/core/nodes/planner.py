@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Optional
+
 from ..workflow_types import WorkflowContext
 
 
 @dataclass(frozen=True)
 class RequestPlannerConfig:
     default_website_fetch_cap: int = 400
+    # Optional wall-clock budget for website enrichment; leads not reached in time get
+    # needs_review. None (the default) leaves enrichment unbounded.
+    default_enrichment_deadline_s: Optional[float] = None
 
 
 class RequestPlannerNode:
@@ -19,10 +24,12 @@ class RequestPlannerNode:
         req = ctx.request
         options = req.get("options", {}) or {}
         website_cap = int(options.get("website_fetch_cap") or self.config.default_website_fetch_cap)
+        deadline_s = options.get("enrichment_deadline_s") or self.config.default_enrichment_deadline_s
 
         ctx.plan = {
             "target_count": int(req.get("target_count", 100)),
             "website_fetch_cap": website_cap,
             "include_socials": bool(options.get("include_socials", True)),
+            "enrichment_deadline_s": float(deadline_s) if deadline_s else None,
         }
         return ctx
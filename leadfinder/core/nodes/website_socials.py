@@ -1,79 +1,236 @@
 from __future__ import annotations
 
-import re
-from urllib.parse import urlparse
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Dict, Optional
 import httpx
 
+from ...utils.host_latency import HostTimeouts, default_host_timeouts
+from ..html_links import SOCIAL_DOMAINS  # noqa: F401  (re-exported for callers)
+from ..parse_pool import parse_socials
+from ..website_cache import CachedWebsite, WebsiteCache, content_hash, default_website_cache
 from ..workflow_types import WorkflowContext
 
 
-SOCIAL_DOMAINS = {
-    "instagram.com": "instagram",
-    "facebook.com": "facebook",
-    "linkedin.com": "linkedin",
-    "tiktok.com": "tiktok",
-    "x.com": "x",
-    "twitter.com": "x",
-    "youtube.com": "youtube",
-}
+def _needs_review(cached: Optional[CachedWebsite], reason: str) -> dict:
+    """Enrichment for a lead that was not fetched this run; keeps stale cached socials if any."""
+    return {
+        "socials": dict(cached.socials) if cached is not None else {},
+        "confidence": 0.5 if cached is not None and cached.socials else 0.0,
+        "reasons": [reason] + (["stale_cache"] if cached is not None else []),
+        "source": "website",
+        "needs_review": True,
+    }
 
 
-def _extract_links(html: str) -> list[str]:
-    return re.findall(r'href=["\'](.*?)["\']', html, flags=re.IGNORECASE)
-
-
-def _pick_socials(urls: list[str]) -> tuple[dict, list[str]]:
-    socials = {}
-    reasons = []
-    for u in urls:
-        try:
-            host = (urlparse(u).netloc or "").lower()
-        except Exception:
-            continue
-        for domain, key in SOCIAL_DOMAINS.items():
-            if domain in host and key not in socials:
-                socials[key] = u
-                reasons.append("linked_from_website")
-    return socials, reasons
+def _found(entry: CachedWebsite) -> dict:
+    return {"socials": entry.socials, "reasons": entry.reasons, "fetched_at": entry.fetched_at}
 
 
 class WebsiteSocialExtractorNode:
     name = "website_social_extractor"
 
-    def __init__(self, timeout_s: float = 15.0):
+    def __init__(
+        self,
+        timeout_s: float = 15.0,
+        cache: Optional[WebsiteCache] = None,
+        parse_executor: Optional[Executor] = None,
+        host_timeouts: Optional[HostTimeouts] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        # Upper bound per request; per-host timeouts are learned below it.
         self.timeout_s = timeout_s
+        self.host_timeouts = host_timeouts if host_timeouts is not None else default_host_timeouts()
+        self.cache = cache if cache is not None else default_website_cache()
+        # None -> shared pool from parse_pool.get_parse_executor()
+        self.parse_executor = parse_executor
+        # url -> in-flight fetch, so concurrent runs sharing this node fetch each site once.
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Custom transport for the website client (tests, proxies).
+        self.transport = transport
+
+    async def _fetch_shared(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timeout: httpx.Timeout,
+        deadline_clamped: bool = False,
+    ) -> tuple[Optional[dict], str]:
+        fut = self._inflight.get(url)
+        if fut is not None:
+            try:
+                found, _ = await asyncio.shield(fut)
+                return found, "fresh"
+            except asyncio.CancelledError:
+                # The run that owns the fetch hit its deadline; fetch it ourselves instead
+                # unless this task is being cancelled too.
+                if not fut.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        fut = asyncio.ensure_future(self._fetch_socials(client, url, timeout, deadline_clamped))
+        self._inflight[url] = fut
+        try:
+            return await fut
+        finally:
+            if self._inflight.get(url) is fut:
+                del self._inflight[url]
+
+    async def _fetch_socials(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timeout: httpx.Timeout,
+        deadline_clamped: bool = False,
+    ) -> tuple[Optional[dict], str]:
+        """
+        Returns (cache-entry-like dict or None, outcome) where outcome is one of
+        "fresh" (served from cache, no request), "revalidated" (304 / unchanged body),
+        "fetched" (downloaded and parsed) or "failed".
+        """
+        cached = self.cache.get(url)
+        if cached is not None and cached.is_fresh():
+            return _found(cached), "fresh"
+
+        headers = cached.conditional_headers() if cached is not None else {}
+        started = time.monotonic()
+        try:
+            r = await client.get(url, headers=headers, timeout=timeout)
+        except httpx.TransportError as e:
+            # Timeouts and connection failures put the host into a fast-fail cooldown, unless
+            # the timeout was cut short by the search deadline rather than the host's own.
+            if not (deadline_clamped and isinstance(e, httpx.TimeoutException)):
+                self.host_timeouts.record_failure(url)
+            raise
+        self.host_timeouts.record_success(url, time.monotonic() - started)
+        etag = r.headers.get("etag")
+        last_modified = r.headers.get("last-modified")
+
+        if r.status_code == 304 and cached is not None:
+            cached = self.cache.extend(cached, etag=etag, last_modified=last_modified)
+            return _found(cached), "revalidated"
+        if r.status_code >= 400:
+            return None, "failed"
+
+        digest = content_hash(r.content)
+        if cached is not None and cached.content_hash == digest:
+            # Server ignored the validators but the page is byte-identical: skip re-parsing.
+            cached = self.cache.extend(cached, etag=etag, last_modified=last_modified)
+            return _found(cached), "revalidated"
+
+        socials, reasons = await parse_socials(
+            r.content,
+            str(r.url),
+            r.encoding or "utf-8",
+            executor=self.parse_executor,
+        )
+        entry = self.cache.put(
+            url,
+            socials,
+            reasons,
+            etag=etag,
+            last_modified=last_modified,
+            content_hash=digest,
+        )
+        return _found(entry), "fetched"
 
     async def run(self, ctx: WorkflowContext) -> WorkflowContext:
         if not ctx.plan.get("include_socials", True):
             return ctx
 
         cap = int(ctx.plan.get("website_fetch_cap", 400))
+        deadline_s = ctx.plan.get("enrichment_deadline_s")
+        deadline = time.monotonic() + float(deadline_s) if deadline_s else None
         used = 0
+        skipped_deadline = 0
+        skipped_host = 0
+        cache_hits = 0
+        revalidated = 0
+        reused = 0
+        # Enrichments carried over from an earlier run (refresh mode) are kept while fresh.
+        now = time.time()
+        prior = {
+            k: e
+            for k, e in (ctx.website_enrichments or {}).items()
+            if now - float(e.get("fetched_at") or 0.0) < self.cache.ttl_s
+        }
         enrichments = {}
 
-        async with httpx.AsyncClient(timeout=self.timeout_s, follow_redirects=True) as client:
+        async with httpx.AsyncClient(
+            timeout=self.timeout_s, follow_redirects=True, transport=self.transport
+        ) as client:
             for score, breakdown, c in getattr(ctx, "scored", []):
-                if used >= cap:
-                    break
                 if not c.website_url:
                     continue
-                try:
-                    r = await client.get(c.website_url)
-                    used += 1
-                    if r.status_code >= 400:
+                key = f"{c.source}:{c.source_id}"
+                if key in prior:
+                    enrichments[key] = prior[key]
+                    reused += 1
+                    continue
+                cached = self.cache.get(c.website_url)
+                remaining = None
+                if cached is None or not cached.is_fresh():
+                    if used >= cap:
+                        if cached is not None:
+                            enrichments[key] = _needs_review(cached, "website_fetch_cap_reached")
                         continue
-                    links = _extract_links(r.text)
-                    socials, reasons = _pick_socials(links)
-                    if socials:
-                        enrichments[f"{c.source}:{c.source_id}"] = {
-                            "socials": socials,
-                            "confidence": 0.95,
-                            "reasons": reasons,
-                            "source": "website",
-                        }
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    skip_reason = None
+                    if remaining is not None and remaining <= 0:
+                        skip_reason = "enrichment_deadline_exceeded"
+                        skipped_deadline += 1
+                    elif self.host_timeouts.should_skip(c.website_url):
+                        skip_reason = "host_recently_failed"
+                        skipped_host += 1
+                    if skip_reason:
+                        enrichments[key] = _needs_review(cached, skip_reason)
+                        continue
+                connect_s, read_s = self.host_timeouts.timeouts_for(c.website_url)
+                connect_s, read_s = min(connect_s, self.timeout_s), min(read_s, self.timeout_s)
+                deadline_clamped = remaining is not None and remaining < max(connect_s, read_s)
+                if remaining is not None:
+                    connect_s, read_s = min(connect_s, remaining), min(read_s, remaining)
+                timeout = httpx.Timeout(read_s, connect=connect_s)
+                try:
+                    # httpx timeouts are per phase (and reset per read and redirect); this
+                    # bounds the whole fetch, parse included, by the time left.
+                    async with asyncio.timeout(remaining):
+                        found, outcome = await self._fetch_shared(
+                            client, c.website_url, timeout, deadline_clamped
+                        )
+                except TimeoutError:
+                    enrichments[key] = _needs_review(cached, "enrichment_deadline_exceeded")
+                    skipped_deadline += 1
+                    continue
+                except httpx.TimeoutException:
+                    enrichments[key] = _needs_review(cached, "website_timeout")
+                    continue
                 except Exception:
                     continue
+                if outcome == "fresh":
+                    cache_hits += 1
+                else:
+                    used += 1
+                    if outcome == "revalidated":
+                        revalidated += 1
+                if found and found["socials"]:
+                    enrichments[key] = {
+                        "socials": found["socials"],
+                        "confidence": 0.95,
+                        "reasons": found["reasons"],
+                        "source": "website",
+                        # Age of the underlying data, so refreshes re-fetch it on time.
+                        "fetched_at": found["fetched_at"],
+                    }
 
         ctx.website_enrichments = enrichments
-        ctx.budget_usage = {"website_fetches_used": used, "website_fetches_cap": cap}
+        ctx.budget_usage = {
+            "website_fetches_used": used,
+            "website_fetches_cap": cap,
+            "website_cache_hits": cache_hits,
+            "website_revalidations": revalidated,
+            "website_enrichments_reused": reused,
+            "website_fetches_skipped_deadline": skipped_deadline,
+            "website_fetches_skipped_host": skipped_host,
+        }
         return ctx
@@ -1,4 +1,7 @@
+import asyncio
 import uuid
+from .batch import BatchPlan, plan_search_batch
+from .checkpoint import build_refresh_context, default_checkpoint_store
 from .config import settings
 
 # NOTE: This is a placeholder orchestrator.
@@ -6,9 +9,9 @@ from .config import settings
 # For the starter project, we just create an ID and store minimal in-memory state.
 
 _IN_MEMORY = {}
+_BATCHES = {}
 
-async def submit_search(req) -> str:
-    search_id = str(uuid.uuid4())
+def _register_search(search_id: str) -> None:
     _IN_MEMORY[search_id] = {
         "search_id": search_id,
         "status": "queued",
@@ -16,7 +19,51 @@ async def submit_search(req) -> str:
         "budget_usage": {"paid_enrichments_used": 0},
         "summary": {"lead_count_ready": 0},
     }
+
+async def submit_search(req) -> str:
+    """
+    With `req.refresh_of`, the new search starts from the earlier search's checkpoint:
+    the refresh context is saved as this search's checkpoint, so the worker's runner
+    resumes from it and only re-fetches stale data. Raises KeyError when the earlier
+    search has no checkpoint (unknown or past retention).
+    """
+    search_id = str(uuid.uuid4())
+    if req.refresh_of:
+        store = default_checkpoint_store()
+        ctx = await asyncio.to_thread(
+            build_refresh_context,
+            store,
+            req.refresh_of,
+            search_id,
+            request=req.model_dump(exclude={"refresh_of"}),
+            discovery_ttl_s=settings.checkpoint_retention_s,
+        )
+        await asyncio.to_thread(store.save, ctx)
+    _register_search(search_id)
+    _IN_MEMORY[search_id]["refresh_of"] = req.refresh_of
     return search_id
 
+async def submit_search_batch(req) -> tuple[str, list[str], dict]:
+    """
+    Plans a batch of searches as one unit (shared anchors, one discovery per unique
+    query+anchor). Each search still gets its own id and status record. Only the
+    (search_id, request) pairs are kept until a worker takes the batch.
+    """
+    batch_id = str(uuid.uuid4())
+    requests = [(str(uuid.uuid4()), s.model_dump(exclude={"refresh_of"})) for s in req.searches]
+    plan = await plan_search_batch(batch_id, requests)
+    for search_id, _ in requests:
+        _register_search(search_id)
+        _IN_MEMORY[search_id]["progress"]["anchors_total"] = len(plan.search_units[search_id])
+    _BATCHES[batch_id] = requests
+    return batch_id, [sid for sid, _ in requests], plan.summary()
+
+async def take_search_batch(batch_id: str) -> BatchPlan | None:
+    """Removes a queued batch and returns its plan for SearchBatchRunner (planning is cheap)."""
+    requests = _BATCHES.pop(batch_id, None)
+    if requests is None:
+        return None
+    return await plan_search_batch(batch_id, requests)
+
 async def get_search_status(search_id: str):
     return _IN_MEMORY.get(search_id)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from .html_links import extract_socials
+
+# Shared executor for CPU-bound HTML parsing so large pages never run on the event loop.
+# HTML_PARSE_EXECUTOR: "process" (default), "thread", or "inline" (parse on the loop; tests/dev).
+
+_EXECUTOR: Optional[Executor] = None
+
+
+def _workers(configured: int) -> int:
+    return configured if configured > 0 else (os.cpu_count() or 1)
+
+
+def get_parse_executor() -> Optional[Executor]:
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        return _EXECUTOR
+
+    from .config import settings
+
+    kind = settings.html_parse_executor.lower()
+    if kind == "inline":
+        return None
+    if kind == "thread":
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=_workers(settings.html_parse_workers), thread_name_prefix="html-parse"
+        )
+    else:
+        # The pool is created lazily inside a process that already runs threads (uvicorn,
+        # asyncio.to_thread); forking from it can deadlock, so use a forkserver.
+        _EXECUTOR = ProcessPoolExecutor(
+            max_workers=_workers(settings.html_parse_workers),
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _EXECUTOR
+
+
+def shutdown_parse_executor() -> None:
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    _EXECUTOR = None
+
+
+def _trim(body: bytes, max_bytes: int) -> bytes:
+    """
+    Keep the head and tail of oversized pages: social links live in the <head> meta tags
+    and the header/footer, and sending less across the process boundary is cheaper.
+    """
+    if max_bytes <= 0 or len(body) <= max_bytes:
+        return body
+    # Keep both halves 4-byte aligned so UTF-16/UTF-32 pages still decode after the cut.
+    half = (max_bytes // 8) * 4
+    return body[:half] + body[-half:]
+
+
+async def parse_socials(
+    body: bytes,
+    base_url: str = "",
+    encoding: str = "utf-8",
+    *,
+    executor: Optional[Executor] = None,
+    max_bytes: Optional[int] = None,
+) -> Tuple[dict, list]:
+    """
+    Runs `extract_socials` off the event loop. Bytes are passed as-is (no decode/re-encode)
+    so pickling to worker processes is a single buffer copy.
+    """
+    if max_bytes is None:
+        from .config import settings
+
+        max_bytes = settings.html_parse_max_bytes
+    body = _trim(body, max_bytes)
+    pool = executor if executor is not None else get_parse_executor()
+    if pool is None:
+        return extract_socials(body, base_url, encoding)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, extract_socials, body, base_url, encoding)
@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+from leadfinder.core.checkpoint import CheckpointStore
 from leadfinder.core.workflow import WorkflowRunner
 from leadfinder.core.workflow_types import WorkflowContext
 from leadfinder.core.nodes.planner import RequestPlannerNode
@@ -49,11 +50,13 @@ async def main():
                 WebsiteSocialExtractorNode(),
                 AssembleResultsNode(),
                 ExportGeneratorNode(export_dir=os.getenv("EXPORT_DIR", "./exports")),
-            ]
+            ],
+            checkpoint_store=CheckpointStore(os.getenv("CHECKPOINT_DIR", "./checkpoints")),
         )
 
         ctx = WorkflowContext(search_id="example", request=req)
-        ctx = await runner.run(ctx)
+        # Fixed search_id: don't resume a finished run; the checkpoint is still kept for refreshes.
+        ctx = await runner.run(ctx, resume=False)
         print(f"Got {len(ctx.results)} results; wrote exports: {ctx.export_paths}")
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedWebsite:
+    """
+    A website socials result plus the HTTP validators needed to revalidate it.
+    Negative results (no socials found) are cached too, so they can be revalidated cheaply.
+    """
+    url: str
+    socials: Dict[str, str]
+    reasons: List[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    fetched_at: float = 0.0
+    expires_at: float = 0.0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        h = {}
+        if self.etag:
+            h["If-None-Match"] = self.etag
+        if self.last_modified:
+            h["If-Modified-Since"] = self.last_modified
+        return h
+
+
+@dataclass
+class WebsiteCache:
+    """
+    In-memory `site_socials:{url}` cache, LRU-bounded to `max_entries`. Expired entries
+    without HTTP validators are dropped on lookup since they can't be revalidated.
+    Swap for a Redis/DB-backed implementation with the same methods in a real deployment.
+    """
+    ttl_s: float = 60 * 24 * 3600.0
+    max_entries: int = 100_000
+    _entries: "OrderedDict[str, CachedWebsite]" = field(default_factory=OrderedDict)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return f"site_socials:{url}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, url: str) -> Optional[CachedWebsite]:
+        key = self.key(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_fresh() and not entry.has_validators():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, entry: CachedWebsite) -> None:
+        key = self.key(entry.url)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(
+        self,
+        url: str,
+        socials: Dict[str, str],
+        reasons: List[str],
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> CachedWebsite:
+        now = time.time()
+        entry = CachedWebsite(
+            url=url,
+            socials=dict(socials),
+            reasons=list(reasons),
+            etag=etag,
+            last_modified=last_modified,
+            content_hash=content_hash,
+            fetched_at=now,
+            expires_at=now + self.ttl_s,
+        )
+        self._store(entry)
+        return entry
+
+    def extend(
+        self,
+        entry: CachedWebsite,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CachedWebsite:
+        """Extend the TTL of an entry that was revalidated (304 or unchanged body)."""
+        now = time.time()
+        entry = replace(
+            entry,
+            etag=etag or entry.etag,
+            last_modified=last_modified or entry.last_modified,
+            fetched_at=now,
+            expires_at=now + self.ttl_s,
+        )
+        self._store(entry)
+        return entry
+
+
+_DEFAULT_CACHE: Optional[WebsiteCache] = None
+
+
+def default_website_cache() -> WebsiteCache:
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        from .config import settings
+
+        _DEFAULT_CACHE = WebsiteCache(
+            ttl_s=settings.website_cache_ttl_s, max_entries=settings.website_cache_max_entries
+        )
+    return _DEFAULT_CACHE
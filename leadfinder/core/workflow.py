@@ -1,15 +1,88 @@
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from typing import List, Optional
 
+from .checkpoint import CheckpointStore
+from .events import EventBus, default_event_bus
 from .workflow_types import WorkflowContext
 
 
+def _node_name(node) -> str:
+    return getattr(node, "name", type(node).__name__)
+
+
+def _progress(ctx: WorkflowContext, node_names: List[str]) -> dict:
+    # Nodes completed before this runner (batch planning, refresh reuse) count toward both totals.
+    done = set(ctx.completed_nodes)
+    return {
+        "nodes_total": len(done | set(node_names)),
+        "nodes_done": len(done),
+        "anchors_total": len(ctx.anchors),
+        "candidates": len(ctx.raw_candidates),
+        "leads_scored": len(ctx.scored),
+        "leads_ready": len(ctx.results),
+    }
+
+
 class WorkflowRunner:
-    def __init__(self, nodes: List):
+    def __init__(
+        self,
+        nodes: List,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        event_bus: Optional[EventBus] = None,
+    ):
         self.nodes = nodes
+        self.checkpoint_store = checkpoint_store
+        self.event_bus = event_bus if event_bus is not None else default_event_bus()
+
+    def _publish_ready_leads(self, ctx: WorkflowContext, published: set) -> None:
+        new = [r for r in ctx.results if r.get("business_key") not in published]
+        if new:
+            published.update(r.get("business_key") for r in new)
+            self.event_bus.publish(ctx.search_id, "leads", {"leads": new})
+
+    async def run(self, ctx: WorkflowContext, *, resume: bool = True) -> WorkflowContext:
+        """
+        Executes nodes in order. With a checkpoint store the context is saved after every
+        node, and (when `resume` is set) a previous checkpoint for the same search_id is
+        loaded so a crashed or cancelled run continues after its last finished node.
+        Node transitions, progress, budget usage and newly ready leads are published
+        to the event bus as they happen.
+        """
+        if self.checkpoint_store is not None and resume:
+            saved = self.checkpoint_store.load(ctx.search_id)
+            if saved is not None:
+                ctx = saved
+
+        bus = self.event_bus
+        published_leads: set = set()
+        node_names = [_node_name(n) for n in self.nodes]
+        budget = dict(ctx.budget_usage)
+        bus.publish(ctx.search_id, "status", {"status": "running"})
+
+        try:
+            for node in self.nodes:
+                name = _node_name(node)
+                if name in ctx.completed_nodes:
+                    continue
+                bus.publish(ctx.search_id, "node", {"node": name, "state": "started"})
+                ctx = await node.run(ctx)
+                ctx.completed_nodes.append(name)
+                if self.checkpoint_store is not None:
+                    # Serialization + gzip + fsync of large contexts must not block the loop.
+                    await asyncio.to_thread(self.checkpoint_store.save, ctx)
+
+                bus.publish(ctx.search_id, "node", {"node": name, "state": "finished"})
+                bus.publish(ctx.search_id, "progress", _progress(ctx, node_names))
+                if ctx.budget_usage != budget:
+                    budget = dict(ctx.budget_usage)
+                    bus.publish(ctx.search_id, "budget_usage", budget)
+                self._publish_ready_leads(ctx, published_leads)
+        except BaseException as e:
+            status = "cancelled" if not isinstance(e, Exception) else "failed"
+            bus.publish(ctx.search_id, "status", {"status": status, "error": str(e) or type(e).__name__})
+            raise
 
-    async def run(self, ctx: WorkflowContext) -> WorkflowContext:
-        for node in self.nodes:
-            ctx = await node.run(ctx)
+        bus.publish(ctx.search_id, "status", {"status": "complete", "lead_count_ready": len(ctx.results)})
         return ctx
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -20,3 +20,10 @@ class WorkflowContext:
     budget_usage: Dict[str, Any] = field(default_factory=dict)
     export_paths: Dict[str, str] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+
+    # Names of nodes already executed (checkpoint/resume bookkeeping).
+    completed_nodes: List[str] = field(default_factory=list)
+    # Set when this run refreshes an earlier search: reused outputs are kept, stale ones re-fetched.
+    refresh_of: Optional[str] = None
+    # Unix time the candidates were discovered; used to decide staleness on refresh.
+    discovered_at: Optional[float] = None
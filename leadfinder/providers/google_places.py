@@ -87,11 +87,21 @@ class GooglePlacesProvider:
     provider_name = "google_places"
     _BASE_URL = "https://places.googleapis.com/v1"
 
-    def __init__(self, cfg: GooglePlacesConfig, client: Optional[httpx.AsyncClient] = None):
+    def __init__(
+        self,
+        cfg: GooglePlacesConfig,
+        client: Optional[httpx.AsyncClient] = None,
+        details_cache: Optional[Dict[str, "asyncio.Future[Dict[str, Any]]"]] = None,
+    ):
         if not cfg.api_key:
             raise ValueError("GooglePlacesConfig.api_key is required")
         self.cfg = cfg
         self._client = client
+        # Optional place_id -> details memo. Share one dict across searches (e.g. a batch)
+        # so each place is hydrated once; concurrent lookups await the same in-flight call.
+        self._details_cache = details_cache
+        # Logical API calls made (retries not counted), for budget/benchmark reporting.
+        self.calls: Dict[str, int] = {"search": 0, "details": 0}
 
     async def __aenter__(self):
         if self._client is None:
@@ -192,6 +202,7 @@ class GooglePlacesProvider:
         if page_token:
             body["pageToken"] = page_token
 
+        self.calls["search"] += 1
         search_data = await self._request_with_retries(
             "POST",
             search_url,
@@ -249,6 +260,23 @@ class GooglePlacesProvider:
         return candidates, (str(next_token) if next_token else None)
 
     async def _get_place_details(self, place_id: str) -> Dict[str, Any]:
+        if self._details_cache is None:
+            return await self._fetch_place_details(place_id)
+
+        fut = self._details_cache.get(place_id)
+        if fut is None:
+            fut = asyncio.ensure_future(self._fetch_place_details(place_id))
+            self._details_cache[place_id] = fut
+        try:
+            return await asyncio.shield(fut)
+        except Exception:
+            # Don't memoize failures; the next caller retries.
+            if self._details_cache.get(place_id) is fut:
+                del self._details_cache[place_id]
+            raise
+
+    async def _fetch_place_details(self, place_id: str) -> Dict[str, Any]:
+        self.calls["details"] += 1
         url = f"{self._BASE_URL}/places/{place_id}"
         return await self._request_with_retries(
             "GET",
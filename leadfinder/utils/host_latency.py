@@ -0,0 +1,103 @@
+# Per-host adaptive timeouts learned from observed website latency.
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> str:
+    try:
+        return (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""
+
+
+@dataclass
+class HostStats:
+    srtt: Optional[float] = None  # smoothed response time (s)
+    rttvar: float = 0.0
+    failures: int = 0  # consecutive timeouts / transport errors
+    blocked_until: float = 0.0
+
+
+@dataclass(frozen=True)
+class HostTimeoutConfig:
+    # Used until a host has been observed at least once.
+    default_connect_s: float = 5.0
+    default_read_s: float = 15.0
+    min_timeout_s: float = 1.0
+    max_timeout_s: float = 15.0
+    # Smoothing as in TCP RTO estimation (RFC 6298).
+    alpha: float = 0.125
+    beta: float = 0.25
+    k: float = 4.0
+    # Connect timeout as a fraction of the learned response timeout: the handshake is
+    # only part of the observed response time.
+    connect_fraction: float = 0.5
+    # After a failure, skip the host for base * 2**(failures-1) seconds (capped).
+    cooldown_base_s: float = 300.0
+    cooldown_max_s: float = 6 * 3600.0
+    max_hosts: int = 50_000
+
+
+class HostTimeouts:
+    """
+    Learns connect/read timeouts per host from observed response times, and fast-fails
+    hosts that timed out or refused connections recently.
+    """
+
+    def __init__(self, cfg: Optional[HostTimeoutConfig] = None):
+        self.cfg = cfg or HostTimeoutConfig()
+        self._hosts: Dict[str, HostStats] = {}
+
+    def _stats(self, host: str) -> HostStats:
+        st = self._hosts.get(host)
+        if st is None:
+            if len(self._hosts) >= self.cfg.max_hosts:
+                # Drop the oldest-inserted host; good enough to bound memory.
+                self._hosts.pop(next(iter(self._hosts)))
+            st = self._hosts[host] = HostStats()
+        return st
+
+    def _clamp(self, v: float) -> float:
+        return max(self.cfg.min_timeout_s, min(self.cfg.max_timeout_s, v))
+
+    def timeouts_for(self, url: str) -> Tuple[float, float]:
+        """Returns the learned (connect_s, read_s) for the url's host."""
+        st = self._hosts.get(host_of(url))
+        if st is None or st.srtt is None:
+            return self.cfg.default_connect_s, self.cfg.default_read_s
+        rto = st.srtt + self.cfg.k * st.rttvar
+        return self._clamp(self.cfg.connect_fraction * rto), self._clamp(rto)
+
+    def should_skip(self, url: str, now: Optional[float] = None) -> bool:
+        st = self._hosts.get(host_of(url))
+        return st is not None and (now if now is not None else time.time()) < st.blocked_until
+
+    def record_success(self, url: str, elapsed_s: float) -> None:
+        st = self._stats(host_of(url))
+        if st.srtt is None:
+            st.srtt, st.rttvar = elapsed_s, elapsed_s / 2
+        else:
+            st.rttvar = (1 - self.cfg.beta) * st.rttvar + self.cfg.beta * abs(st.srtt - elapsed_s)
+            st.srtt = (1 - self.cfg.alpha) * st.srtt + self.cfg.alpha * elapsed_s
+        st.failures = 0
+        st.blocked_until = 0.0
+
+    def record_failure(self, url: str, now: Optional[float] = None) -> None:
+        st = self._stats(host_of(url))
+        st.failures += 1
+        cooldown = min(self.cfg.cooldown_max_s, self.cfg.cooldown_base_s * 2 ** (st.failures - 1))
+        st.blocked_until = (now if now is not None else time.time()) + cooldown
+
+
+_DEFAULT: Optional[HostTimeouts] = None
+
+
+def default_host_timeouts() -> HostTimeouts:
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = HostTimeouts()
+    return _DEFAULT
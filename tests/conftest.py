@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+# Parse HTML on the loop in tests; the process pool is exercised by the benchmark.
+os.environ.setdefault("HTML_PARSE_EXECUTOR", "inline")
+
+
+class Step:
+    """Minimal workflow node: records its name in `calls`, marks ctx.plan, optionally fails."""
+
+    def __init__(self, name, calls=None, fail=False):
+        self.name = name
+        self.calls = calls if calls is not None else []
+        self.fail = fail
+
+    async def run(self, ctx):
+        self.calls.append(self.name)
+        if self.fail:
+            raise RuntimeError("boom")
+        ctx.plan[self.name] = True
+        return ctx
+
+
+@pytest.fixture
+def step():
+    return Step
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("LEADFINDER_API_KEY", "test-key")
+
+from leadfinder.api.app import app  # noqa: E402
+
+HEADERS = {"X-API-Key": os.environ["LEADFINDER_API_KEY"]}
+SEARCH = {
+    "query": "coffee",
+    "geo_scope": {"center_lat": 49.28, "center_lng": -123.12, "radius_km": 5},
+    "target_count": 10,
+}
+
+
+def test_refresh_of_must_be_a_uuid():
+    with TestClient(app) as client:
+        r = client.post("/v1/searches", json=SEARCH | {"refresh_of": "../../etc/passwd"}, headers=HEADERS)
+    assert r.status_code == 422
+
+
+def test_refresh_of_unknown_search_is_404():
+    with TestClient(app) as client:
+        r = client.post(
+            "/v1/searches",
+            json=SEARCH | {"refresh_of": "00000000-0000-4000-8000-000000000000"},
+            headers=HEADERS,
+        )
+    assert r.status_code == 404
+
+
+def test_refresh_of_corrupt_checkpoint_is_409(tmp_path, monkeypatch):
+    from leadfinder.core import checkpoint
+
+    search_id = "00000000-0000-4000-8000-000000000001"
+    (tmp_path / f"{search_id}.json.gz").write_bytes(b"garbage")
+    monkeypatch.setattr(checkpoint, "_DEFAULT_STORE", checkpoint.CheckpointStore(str(tmp_path)))
+    with TestClient(app) as client:
+        r = client.post("/v1/searches", json=SEARCH | {"refresh_of": search_id}, headers=HEADERS)
+    assert r.status_code == 409
+
+
+def test_batch_rejects_refresh_of():
+    entry = SEARCH | {"refresh_of": "00000000-0000-4000-8000-000000000000"}
+    with TestClient(app) as client:
+        r = client.post("/v1/search-batches", json={"searches": [SEARCH, entry]}, headers=HEADERS)
+    assert r.status_code == 422
+
+
+def test_batch_keeps_only_requests_until_taken():
+    from leadfinder.core import orchestrator
+
+    with TestClient(app) as client:
+        r = client.post("/v1/search-batches", json={"searches": [SEARCH, SEARCH]}, headers=HEADERS)
+    assert r.status_code == 200, r.text
+    batch_id = r.json()["batch_id"]
+    assert [sid for sid, _ in orchestrator._BATCHES[batch_id]] == r.json()["search_ids"]
+
+    plan = asyncio.run(orchestrator.take_search_batch(batch_id))
+    assert set(plan.contexts) == set(r.json()["search_ids"])
+    assert batch_id not in orchestrator._BATCHES
+    assert asyncio.run(orchestrator.take_search_batch(batch_id)) is None
+
+
+def _sse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    from leadfinder.core import events
+
+    bus = events.EventBus(buffer_size=2)
+    monkeypatch.setattr(events, "_DEFAULT_BUS", bus)
+    return bus
+
+
+def test_events_unknown_search_is_404(bus):
+    with TestClient(app) as client:
+        r = client.get("/v1/searches/00000000-0000-4000-8000-00000000dead/events", headers=HEADERS)
+    assert r.status_code == 404
+
+
+def test_events_replays_snapshot_and_closes_on_terminal_status(bus):
+    bus.publish("s1", "status", {"status": "running"})
+    bus.publish("s1", "progress", {"nodes_done": 3, "nodes_total": 7})
+    bus.publish("s1", "leads", {"count": 5})  # not part of the snapshot
+    bus.publish("s1", "status", {"status": "complete"})
+
+    with TestClient(app) as client:
+        r = client.get("/v1/searches/s1/events", headers=HEADERS)
+    assert r.status_code == 200
+    assert _sse_events(r.text) == [
+        ("progress", {"nodes_done": 3, "nodes_total": 7}),
+        ("status", {"status": "complete"}),
+    ]
+
+
+class _StubRequest:
+    async def is_disconnected(self):
+        return False
+
+
+def test_events_reports_lag_after_subscriber_overflow(bus):
+    from leadfinder.api.routes import stream_search_events
+
+    bus.publish("s1", "status", {"status": "running"})
+
+    async def run():
+        response = await stream_search_events("s1", _StubRequest())
+        stream = response.body_iterator
+        chunks = [await stream.__anext__()]  # snapshot replay; subscribed from here on
+        for i in range(4):
+            bus.publish("s1", "leads", {"i": i})
+        bus.publish("s1", "status", {"status": "complete"})
+        chunks += [chunk async for chunk in stream]
+        return "".join(chunks)
+
+    assert _sse_events(asyncio.run(run())) == [
+        ("status", {"status": "running"}),
+        ("lagged", {"dropped": 3}),
+        ("leads", {"i": 3}),
+        ("status", {"status": "complete"}),
+    ]
+    assert not bus._subs
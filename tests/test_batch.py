@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import pytest
+
+from leadfinder.core.batch import SearchBatchRunner, plan_search_batch
+from leadfinder.providers.base import RawCandidate
+from leadfinder.providers.google_places import GooglePlacesConfig, GooglePlacesProvider
+
+VANCOUVER = {"center_lat": 49.28, "center_lng": -123.12, "radius_km": 5}
+TORONTO = {"center_lat": 43.65, "center_lng": -79.38, "radius_km": 5}
+
+
+def _req(query, geo=VANCOUVER, target=10):
+    return {"query": query, "geo_scope": geo, "target_count": target}
+
+
+class _FakeProvider:
+    def __init__(self, fail_queries=()):
+        self.fail_queries = set(fail_queries)
+        self.calls = []
+
+    async def search(self, query, anchor, *, page_token=None):
+        self.calls.append((query, anchor.center_lat))
+        if query in self.fail_queries:
+            raise RuntimeError("places down")
+        return [
+            RawCandidate("fake", f"{query}:{i}", {}, query, "addr", None, None, None, None, None, None, None, [])
+            for i in range(3)
+        ], None
+
+
+def test_plan_merges_query_variants_and_shares_anchors():
+    plan = asyncio.run(
+        plan_search_batch(
+            "b",
+            [
+                ("s1", _req("Coffee Shops")),
+                ("s2", _req("  coffee   shops ")),
+                ("s3", _req("bakery")),
+                ("s4", _req("coffee shops", geo=TORONTO)),
+            ],
+        )
+    )
+    assert plan.summary() == {"searches": 4, "anchors_unique": 2, "discovery_units": 3}
+    assert plan.search_units["s1"] == plan.search_units["s2"]
+    assert plan.search_units["s3"] != plan.search_units["s1"]
+    assert plan.contexts["s1"].anchors[0] is plan.contexts["s3"].anchors[0]
+    unit = plan.units[plan.search_units["s1"][0]]
+    assert unit.search_ids == ["s1", "s2"]
+
+
+def test_shared_unit_uses_largest_target():
+    plan = asyncio.run(
+        plan_search_batch("b", [("s1", _req("coffee", target=10)), ("s2", _req("coffee", target=40))])
+    )
+    assert len(plan.units) == 1
+    assert plan.units[0].target_count == 40
+
+
+def test_runner_discovers_each_unit_once_and_splits_results():
+    plan = asyncio.run(
+        plan_search_batch("b", [("s1", _req("coffee")), ("s2", _req("COFFEE")), ("s3", _req("bakery"))])
+    )
+    provider = _FakeProvider()
+    results = asyncio.run(SearchBatchRunner(provider, []).run(plan))
+
+    assert sorted(q for q, _ in provider.calls) == ["bakery", "coffee"]
+    assert [c.source_id for c in results["s1"].raw_candidates] == ["coffee:0", "coffee:1", "coffee:2"]
+    assert results["s2"].raw_candidates == results["s1"].raw_candidates
+    assert [c.name for c in results["s3"].raw_candidates] == ["bakery"] * 3
+    assert all("discover_businesses" in ctx.completed_nodes for ctx in results.values())
+
+
+def test_failed_unit_reports_error_on_each_search_using_it():
+    plan = asyncio.run(
+        plan_search_batch("b", [("s1", _req("coffee")), ("s2", _req("coffee")), ("s3", _req("bakery"))])
+    )
+    results = asyncio.run(SearchBatchRunner(_FakeProvider(fail_queries={"coffee"}), []).run(plan))
+
+    for sid in ("s1", "s2"):
+        assert results[sid].raw_candidates == []
+        assert results[sid].errors == ["discovery failed for anchor 0: places down"]
+    assert results["s3"].errors == []
+    assert len(results["s3"].raw_candidates) == 3
+
+
+def test_failed_details_lookup_is_not_cached():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"id": "p1", "websiteUri": "https://p1.example/"})
+
+    async def run():
+        cache = {}
+        cfg = GooglePlacesConfig(api_key="k", max_retries=0)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            provider = GooglePlacesProvider(cfg, client=client, details_cache=cache)
+            with pytest.raises(RuntimeError):
+                await provider._get_place_details("p1")
+            assert "p1" not in cache
+            first = await provider._get_place_details("p1")
+            again = await provider._get_place_details("p1")
+        return provider, first, again
+
+    provider, first, again = asyncio.run(run())
+    assert first == again == {"id": "p1", "websiteUri": "https://p1.example/"}
+    assert provider.calls["details"] == 2
+    assert attempts == ["/v1/places/p1", "/v1/places/p1"]
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from leadfinder.core.checkpoint import CheckpointError, CheckpointStore, dump_context, load_context
+from leadfinder.core.workflow import WorkflowRunner
+from leadfinder.core.workflow_types import WorkflowContext
+from leadfinder.providers.base import Anchor, RawCandidate
+
+
+def _candidate(i: int) -> RawCandidate:
+    return RawCandidate(
+        source="fake",
+        source_id=str(i),
+        payload={"details": {"id": i}},
+        name=f"Shop {i}",
+        address_full="1 Main St",
+        city=None,
+        region=None,
+        country="CA",
+        lat=49.0,
+        lng=-123.0,
+        phone=None,
+        website_url=f"https://shop{i}.example",
+        categories=["cafe"],
+    )
+
+
+def test_dump_load_round_trip_stores_scored_as_index_refs():
+    ctx = WorkflowContext(search_id="s1", request={"query": "coffee"})
+    ctx.anchors = [Anchor(center_lat=49.0, center_lng=-123.0, radius_km=5.0, quota=10)]
+    ctx.raw_candidates = [_candidate(i) for i in range(3)]
+    outside = _candidate(99)
+    ctx.scored = [(3.0, {"website": 3.0}, ctx.raw_candidates[2]), (1.0, {}, outside)]
+    ctx.completed_nodes = ["request_planner", "score_leads"]
+    ctx.discovered_at = 123.0
+
+    data = dump_context(ctx)
+    assert data["scored"][0][2] == 2
+    assert isinstance(data["scored"][1][2], dict)
+
+    loaded = load_context(data)
+    assert loaded.anchors == ctx.anchors
+    assert loaded.raw_candidates == ctx.raw_candidates
+    assert loaded.scored == ctx.scored
+    assert loaded.scored[0][2] is loaded.raw_candidates[2]
+    assert loaded.completed_nodes == ctx.completed_nodes
+    assert loaded.discovered_at == 123.0
+
+
+def test_resume_after_node_failure_skips_finished_nodes(tmp_path, step):
+    store = CheckpointStore(str(tmp_path))
+    calls = []
+    failing = [step("a", calls), step("b", calls), step("c", calls, fail=True)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(WorkflowRunner(failing, checkpoint_store=store).run(WorkflowContext("s1", {})))
+    assert store.load("s1").completed_nodes == ["a", "b"]
+
+    calls.clear()
+    nodes = [step("a", calls), step("b", calls), step("c", calls)]
+    ctx = asyncio.run(WorkflowRunner(nodes, checkpoint_store=store).run(WorkflowContext("s1", {})))
+    assert calls == ["c"]
+    assert ctx.completed_nodes == ["a", "b", "c"]
+    assert ctx.plan == {"a": True, "b": True, "c": True}
+
+
+def test_prune_removes_checkpoints_past_retention(tmp_path):
+    store = CheckpointStore(str(tmp_path), retention_s=60)
+    store.save(WorkflowContext("old", {}))
+    assert store.prune(now=time.time() + 3600) == 1
+    assert store.load("old") is None
+
+
+def test_ids_escaping_the_checkpoint_dir_are_rejected(tmp_path):
+    store = CheckpointStore(str(tmp_path / "cp"))
+    (tmp_path / "secret.json.gz").write_bytes(b"not a checkpoint")
+    assert store.load_raw("../secret") is None
+    with pytest.raises(ValueError):
+        store.save(WorkflowContext("../secret", {}))
+
+
+def test_corrupt_or_wrong_version_checkpoint_raises_checkpoint_error(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    (tmp_path / "bad.json.gz").write_bytes(b"garbage")
+    with pytest.raises(CheckpointError):
+        store.load("bad")
+
+    data = dump_context(WorkflowContext("s1", {}))
+    data["v"] = 999
+    with pytest.raises(CheckpointError):
+        load_context(data)
@@ -0,0 +1,41 @@
+import asyncio
+
+from leadfinder.core.events import EventBus
+from leadfinder.core.workflow import WorkflowRunner
+from leadfinder.core.workflow_types import WorkflowContext
+
+
+def test_subscription_overflow_drops_oldest_and_counts():
+    bus = EventBus(buffer_size=3)
+    sub = bus.subscribe("s1")
+    for i in range(5):
+        bus.publish("s1", "progress", {"i": i})
+
+    async def drain():
+        return [(await sub.get()).data["i"] for _ in range(3)]
+
+    assert asyncio.run(drain()) == [2, 3, 4]
+    assert sub.take_dropped() == 2
+    assert sub.take_dropped() == 0
+
+
+def test_unsubscribe_stops_delivery_and_snapshot_keeps_latest():
+    bus = EventBus()
+    sub = bus.subscribe("s1")
+    bus.unsubscribe(sub)
+    bus.publish("s1", "progress", {"n": 1})
+    bus.publish("s1", "progress", {"n": 2})
+    assert sub.take_dropped() == 0 and not sub._buf
+    assert [e.data for e in bus.snapshot("s1")] == [{"n": 2}]
+
+
+def test_progress_counts_nodes_completed_before_the_runner(step):
+    bus = EventBus()
+    sub = bus.subscribe("s1")
+    ctx = WorkflowContext("s1", {})
+    ctx.completed_nodes = ["request_planner", "anchor_generator", "discover_businesses"]
+    asyncio.run(WorkflowRunner([step("score_leads")], event_bus=bus).run(ctx))
+
+    progress = [e.data for e in sub._buf if e.type == "progress"]
+    assert progress[-1]["nodes_total"] == 4
+    assert progress[-1]["nodes_done"] == 4
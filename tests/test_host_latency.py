@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+from leadfinder.core.nodes.website_socials import WebsiteSocialExtractorNode
+from leadfinder.core.website_cache import WebsiteCache
+from leadfinder.core.workflow_types import WorkflowContext
+from leadfinder.providers.base import RawCandidate
+from leadfinder.utils.host_latency import HostTimeoutConfig, HostTimeouts
+
+
+def test_unknown_host_uses_defaults():
+    ht = HostTimeouts(HostTimeoutConfig(default_connect_s=5.0, default_read_s=15.0))
+    assert ht.timeouts_for("https://new.example/") == (5.0, 15.0)
+
+
+def test_learned_timeouts_are_clamped():
+    cfg = HostTimeoutConfig(min_timeout_s=1.0, max_timeout_s=15.0)
+    ht = HostTimeouts(cfg)
+    for _ in range(5):
+        ht.record_success("https://fast.example/", 0.01)
+        ht.record_success("https://slow.example/", 30.0)
+    assert ht.timeouts_for("https://fast.example/a") == (1.0, 1.0)
+    assert ht.timeouts_for("https://slow.example/a") == (15.0, 15.0)
+
+
+def test_connect_timeout_is_learned_from_response_time():
+    ht = HostTimeouts(HostTimeoutConfig(min_timeout_s=0.1, connect_fraction=0.5))
+    ht.record_success("https://mid.example/", 2.0)
+    connect, read = ht.timeouts_for("https://mid.example/")
+    assert read == 2.0 + 4 * 1.0
+    assert connect == read / 2
+
+
+def test_failure_cooldown_grows_and_success_resets():
+    ht = HostTimeouts(HostTimeoutConfig(cooldown_base_s=10.0, cooldown_max_s=25.0))
+    url = "https://dead.example/"
+    ht.record_failure(url, now=1000.0)
+    assert ht.should_skip(url, now=1009.0)
+    assert not ht.should_skip(url, now=1011.0)
+
+    ht.record_failure(url, now=2000.0)
+    assert ht.should_skip(url, now=2019.0)
+    ht.record_failure(url, now=3000.0)
+    assert not ht.should_skip(url, now=3026.0)  # 40s capped to 25s
+
+    ht.record_success(url, 0.2)
+    assert not ht.should_skip(url, now=3001.0)
+
+
+def _run_against(handler, deadline_s):
+    """Runs the website node against a local server; returns (ctx, host blocked?, elapsed)."""
+
+    async def main():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        ht = HostTimeouts()
+        node = WebsiteSocialExtractorNode(cache=WebsiteCache(), host_timeouts=ht)
+        url = f"http://127.0.0.1:{port}/"
+        ctx = WorkflowContext("s1", {})
+        ctx.plan = {"website_fetch_cap": 10, "enrichment_deadline_s": deadline_s}
+        ctx.scored = [
+            (
+                1.0,
+                {},
+                RawCandidate("t", "1", {}, "n", "a", None, None, None, None, None, None, url, []),
+            )
+        ]
+        async with server:
+            started = time.monotonic()
+            ctx = await node.run(ctx)
+            elapsed = time.monotonic() - started
+            server.close()
+        return ctx, ht.should_skip(url), elapsed
+
+    return asyncio.run(main())
+
+
+def test_deadline_clamped_timeout_does_not_block_host():
+    async def handler(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        try:
+            await asyncio.sleep(3)
+        finally:
+            writer.close()
+
+    ctx, blocked, _ = _run_against(handler, deadline_s=1.0)
+    enrichment = ctx.website_enrichments["t:1"]
+    assert enrichment["needs_review"]
+    # httpx's clamped read timeout and the wall-clock deadline fire together; either is fine.
+    assert enrichment["reasons"][0] in ("website_timeout", "enrichment_deadline_exceeded")
+    assert not blocked
+
+
+def test_deadline_bounds_slow_drip_responses():
+    # One byte every 100ms never trips httpx's per-read timeout; the deadline must still hold.
+    async def handler(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\nContent-Length: 100\r\n\r\n")
+        try:
+            for _ in range(100):
+                writer.write(b" ")
+                await writer.drain()
+                await asyncio.sleep(0.1)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    ctx, blocked, elapsed = _run_against(handler, deadline_s=0.5)
+    assert elapsed < 2.0
+    assert ctx.website_enrichments["t:1"]["reasons"] == ["enrichment_deadline_exceeded"]
+    assert ctx.website_enrichments["t:1"]["needs_review"]
+    assert ctx.budget_usage["website_fetches_skipped_deadline"] == 1
+    assert not blocked
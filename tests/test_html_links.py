@@ -0,0 +1,51 @@
+from leadfinder.core.html_links import extract_links, extract_socials, pick_socials
+
+
+def test_relative_urls_resolve_against_page_url():
+    html = b'<a href="/about">a</a><a href="menu.html">m</a><a href="#top">t</a><a href="mailto:x@y.z">e</a>'
+    assert extract_links(html, "https://shop.example/dir/") == [
+        "https://shop.example/about",
+        "https://shop.example/dir/menu.html",
+    ]
+
+
+def test_base_href_overrides_page_url():
+    html = b'<base href="https://cdn.example/site/"><a href="contact">c</a><link rel="me" href="//instagram.com/shop">'
+    assert extract_links(html, "https://shop.example/") == [
+        "https://cdn.example/site/contact",
+        "https://instagram.com/shop",
+    ]
+
+
+def test_social_meta_tags_and_twitter_handles():
+    html = (
+        b'<meta property="og:see_also" content="https://www.linkedin.com/company/shop">'
+        b"<meta name='twitter:site' content='@shop'>"
+        b'<meta property="og:title" content="https://facebook.com/not-a-social-tag">'
+    )
+    assert extract_links(html, "https://shop.example/") == [
+        "https://www.linkedin.com/company/shop",
+        "https://x.com/shop",
+    ]
+
+
+def test_host_match_is_exact_or_subdomain():
+    socials, _ = pick_socials(["https://netflix.com/title", "https://www.x.com/shop", "https://notinstagram.com/a"])
+    assert socials == {"x": "https://www.x.com/shop"}
+
+
+def test_extract_socials_keeps_first_link_per_network():
+    html = b'<A HREF=https://instagram.com/first><a href="https://instagram.com/second"><a href="/about">'
+    socials, reasons = extract_socials(html, "https://shop.example/")
+    assert socials == {"instagram": "https://instagram.com/first"}
+    assert reasons == ["linked_from_website"]
+
+
+def test_non_ascii_compatible_encodings_are_transcoded():
+    html = '<base href="https://shop.example/"><a href="https://www.instagram.com/x">ig</a><a href="about">a</a>'
+    for encoding in ("utf-16", "utf-16-le", "utf-32"):
+        assert extract_links(html.encode(encoding), "", encoding) == [
+            "https://www.instagram.com/x",
+            "https://shop.example/about",
+        ]
+    assert extract_socials(html.encode("utf-16"), "", "utf-16")[0] == {"instagram": "https://www.instagram.com/x"}
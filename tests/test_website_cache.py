@@ -0,0 +1,138 @@
+import asyncio
+from dataclasses import replace
+
+import httpx
+
+from leadfinder.core.nodes import website_socials
+from leadfinder.core.nodes.website_socials import WebsiteSocialExtractorNode
+from leadfinder.core.website_cache import WebsiteCache
+from leadfinder.core.workflow_types import WorkflowContext
+from leadfinder.providers.base import RawCandidate
+from leadfinder.utils.host_latency import HostTimeouts
+
+URL = "https://shop.example/"
+PAGE = b'<a href="https://instagram.com/shop">ig</a>'
+VALIDATORS = {"etag": '"v1"', "last-modified": "Mon, 01 Jun 2026 00:00:00 GMT"}
+
+
+def _ctx(cap=10):
+    c = RawCandidate("t", "1", {}, "Shop", "addr", None, None, None, None, None, None, URL, [])
+    ctx = WorkflowContext("s1", {})
+    ctx.plan = {"website_fetch_cap": cap}
+    ctx.scored = [(1.0, {}, c)]
+    return ctx
+
+
+def _node(cache, handler):
+    return WebsiteSocialExtractorNode(
+        cache=cache, host_timeouts=HostTimeouts(), transport=httpx.MockTransport(handler)
+    )
+
+
+def _expire(cache):
+    cache._store(replace(cache.get(URL), expires_at=0.0))
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    real = website_socials.parse_socials
+
+    async def counting(*args, **kwargs):
+        calls.append(args)
+        return await real(*args, **kwargs)
+
+    monkeypatch.setattr(website_socials, "parse_socials", counting)
+    return calls
+
+
+def test_304_extends_ttl_without_parsing(monkeypatch):
+    cache = WebsiteCache(ttl_s=100)
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers=VALIDATORS, content=PAGE)
+
+    node = _node(cache, handler)
+    asyncio.run(node.run(_ctx()))
+    _expire(cache)
+    parses = _count_parses(monkeypatch)
+
+    ctx = asyncio.run(node.run(_ctx()))
+    assert seen[1]["if-none-match"] == '"v1"'
+    assert seen[1]["if-modified-since"] == VALIDATORS["last-modified"]
+    assert parses == []
+    assert cache.get(URL).is_fresh()
+    assert ctx.website_enrichments["t:1"]["socials"] == {"instagram": "https://instagram.com/shop"}
+    assert ctx.budget_usage["website_revalidations"] == 1
+
+
+def test_unchanged_body_is_not_reparsed(monkeypatch):
+    cache = WebsiteCache(ttl_s=100)
+    node = _node(cache, lambda request: httpx.Response(200, headers=VALIDATORS, content=PAGE))
+    asyncio.run(node.run(_ctx()))
+    _expire(cache)
+    parses = _count_parses(monkeypatch)
+
+    ctx = asyncio.run(node.run(_ctx()))
+    assert parses == []
+    assert ctx.budget_usage["website_revalidations"] == 1
+    assert cache.get(URL).is_fresh()
+
+
+def test_fresh_hit_does_not_count_against_cap():
+    cache = WebsiteCache(ttl_s=100)
+    cache.put(URL, {"instagram": "https://instagram.com/shop"}, ["linked_from_website"])
+
+    def handler(request):
+        raise AssertionError("fresh entries must not be fetched")
+
+    ctx = asyncio.run(_node(cache, handler).run(_ctx(cap=0)))
+    assert ctx.website_enrichments["t:1"]["socials"] == {"instagram": "https://instagram.com/shop"}
+    assert ctx.budget_usage["website_fetches_used"] == 0
+    assert ctx.budget_usage["website_cache_hits"] == 1
+
+
+def test_cap_reached_keeps_stale_socials_for_review():
+    cache = WebsiteCache(ttl_s=100)
+    cache.put(URL, {"instagram": "https://instagram.com/shop"}, [], etag='"v1"')
+    _expire(cache)
+
+    def handler(request):
+        raise AssertionError("cap is exhausted")
+
+    ctx = asyncio.run(_node(cache, handler).run(_ctx(cap=0)))
+    e = ctx.website_enrichments["t:1"]
+    assert e["needs_review"] is True
+    assert e["socials"] == {"instagram": "https://instagram.com/shop"}
+    assert e["reasons"] == ["website_fetch_cap_reached", "stale_cache"]
+
+
+def test_cache_is_lru_bounded_and_drops_unrevalidatable_entries():
+    cache = WebsiteCache(ttl_s=100, max_entries=2)
+    cache.put("https://a.example/", {}, [])
+    cache.put("https://b.example/", {}, [])
+    cache.get("https://a.example/")
+    cache.put("https://c.example/", {}, [])
+    assert cache.get("https://b.example/") is None
+    assert len(cache) == 2
+
+    expired = WebsiteCache(ttl_s=-1)
+    expired.put("https://plain.example/", {}, [])
+    expired.put("https://tagged.example/", {}, [], etag='"x"')
+    assert expired.get("https://plain.example/") is None
+    assert expired.get("https://tagged.example/") is not None
+
+
+def test_enrichment_carries_the_cache_entry_age():
+    cache = WebsiteCache(ttl_s=100)
+    entry = cache.put(URL, {"instagram": "https://instagram.com/shop"}, [])
+    cache._store(replace(entry, fetched_at=entry.fetched_at - 90))
+
+    def handler(request):
+        raise AssertionError("fresh entries must not be fetched")
+
+    ctx = asyncio.run(_node(cache, handler).run(_ctx()))
+    assert ctx.website_enrichments["t:1"]["fetched_at"] == entry.fetched_at - 90